@@ -6,15 +6,42 @@ Validates steering documents for proper frontmatter, YAML syntax,
 and file references according to the Kiro steering documentation standards.
 """
 
+import codecs
+import json
+import math
+import multiprocessing
 import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from itertools import chain
 import yaml
-import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Required sections based on steering document standards
+REQUIRED_SECTIONS = ('Core Principle', 'How Kiro Will Write', 'What This Prevents')
+
+# Lowercased names for matching section headings case-insensitively
+_REQUIRED_SECTION_KEYS = tuple(name.lower() for name in REQUIRED_SECTIONS)
+
+_SEP = os.sep
+
+# Sentinel for cache misses where None is a valid cached value
+_MISSING = object()
 
 
 class ValidationError:
+    __slots__ = ('file_path', 'error_type', 'message', 'line_number')
+
     def __init__(self, file_path: str, error_type: str, message: str, line_number: Optional[int] = None):
         self.file_path = file_path
         self.error_type = error_type
@@ -43,128 +70,259 @@ class SteeringValidator:
         'file_references': list
     }
     
-    VALID_CATEGORIES = {
+    _REQUIRED_FIELD_NAMES = frozenset(REQUIRED_FIELDS)
+    _FIELD_TYPES = {**REQUIRED_FIELDS, **OPTIONAL_FIELDS}
+    
+    VALID_CATEGORIES = frozenset({
         'code-quality',
         'testing', 
         'security',
         'frameworks',
         'workflows'
-    }
+    })
     
-    VALID_INCLUSION_VALUES = {
+    VALID_INCLUSION_VALUES = frozenset({
         'always',
         'fileMatch',
         'manual'
-    }
+    })
+    
+    # Sorted once so error messages are built cheaply and read the same on every run
+    _VALID_CATEGORIES_STR = ', '.join(sorted(VALID_CATEGORIES))
+    _VALID_INCLUSION_VALUES_STR = ', '.join(sorted(VALID_INCLUSION_VALUES))
+    
+    # Directories with fewer files than this are validated without a process pool. A file
+    # takes roughly 0.15 ms to validate, while starting workers costs about 10 ms with fork
+    # and 150 ms or more with spawn/forkserver, so the pool only pays off for large trees
+    PARALLEL_MIN_FILES = 200
+    PARALLEL_MIN_FILES_SPAWN = 2000
+    
+    # Target number of chunks handed to each worker, to balance load without per-file overhead
+    PARALLEL_CHUNKS_PER_WORKER = 4
+    
+    # Files are read incrementally in chunks of this many bytes
+    READ_CHUNK_SIZE = 4096
 
-    def __init__(self):
-        self.errors: List[ValidationError] = []
+    def __init__(self, cache_path: Optional[str] = None):
+        self.cache_path = cache_path
+        self._repo_root_cache: Dict[str, Optional[str]] = {}
+        # Only set while a directory run is in progress, so reused validators see fresh results
+        self._exists_cache: Optional[Dict[str, bool]] = None
 
     def validate_file(self, file_path: str) -> List[ValidationError]:
         """Validate a single steering document file."""
-        self.errors = []
+        return self._validate_file(file_path)[0]
+
+    def _validate_file(self, file_path: str) -> Tuple[List[ValidationError], bool]:
+        """Validate a file, also reporting whether the result depends only on its content.
+
+        Results for documents with file_references also depend on other files existing,
+        so they cannot be reused from the result cache.
+        """
+        errors: List[ValidationError] = []
+        self_contained = True
         
         if not os.path.exists(file_path):
-            self.errors.append(ValidationError(file_path, "FILE_NOT_FOUND", "File does not exist"))
-            return self.errors
+            errors.append(ValidationError(file_path, "FILE_NOT_FOUND", "File does not exist"))
+            return errors, False
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            self.errors.append(ValidationError(file_path, "READ_ERROR", f"Cannot read file: {e}"))
-            return self.errors
-            
-        # Extract and validate frontmatter
-        frontmatter, body = self._extract_frontmatter(file_path, content)
-        if frontmatter is not None:
-            self._validate_frontmatter(file_path, frontmatter)
-            self._validate_file_references(file_path, frontmatter)
+            with open(file_path, 'rb') as f:
+                chunks = self._read_chunks(f)
+                head = next(chunks, b'')
+                if not head:
+                    # Zero-byte stubs need no parsing
+                    errors.append(ValidationError(file_path, "MISSING_FRONTMATTER", "File must start with YAML frontmatter"))
+                    return errors, self_contained
+                    
+                # Extract and validate frontmatter
+                frontmatter, remainder = self._extract_frontmatter(file_path, chunks, head, errors)
+                if errors:
+                    # Missing, unclosed or unparseable frontmatter is reported on its own without
+                    # reading further; only bytes already buffered are checked for invalid UTF-8
+                    self._check_encoding(remainder)
+                    return errors, self_contained
+                    
+                if frontmatter is not None:
+                    self._validate_frontmatter(file_path, frontmatter, errors)
+                    self._validate_file_references(file_path, frontmatter, errors)
+                    self_contained = not (isinstance(frontmatter, dict) and 'file_references' in frontmatter)
+                    
+                # Validate markdown structure, streaming the body instead of holding it in memory
+                self._validate_markdown_structure(file_path, self._iter_body_lines(chunks, remainder), errors)
+        except (OSError, UnicodeDecodeError) as e:
+            return [ValidationError(file_path, "READ_ERROR", f"Cannot read file: {e}")], False
             
-        # Validate markdown structure
-        self._validate_markdown_structure(file_path, body)
-        
-        return self.errors
+        return errors, self_contained
+
+    def _read_chunks(self, f: BinaryIO) -> Iterator[bytes]:
+        """Yield non-empty chunks of the file with \\r\\n and lone \\r translated to \\n, as text mode does."""
+        carry = b''
+        for chunk in iter(partial(f.read, self.READ_CHUNK_SIZE), b''):
+            chunk = carry + chunk
+            carry = b''
+            if chunk.endswith(b'\r'):
+                # Hold back a trailing \r in case the next chunk starts with its \n
+                chunk, carry = chunk[:-1], b'\r'
+            if b'\r' in chunk:
+                chunk = chunk.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            if chunk:
+                yield chunk
+        if carry:
+            yield b'\n'
 
-    def _extract_frontmatter(self, file_path: str, content: str) -> Tuple[Optional[Dict], str]:
-        """Extract YAML frontmatter from markdown content."""
-        if not content.startswith('---'):
-            self.errors.append(ValidationError(file_path, "MISSING_FRONTMATTER", "File must start with YAML frontmatter"))
-            return None, content
+    def _extract_frontmatter(self, file_path: str, chunks: Iterator[bytes], head: bytes,
+                             errors: List[ValidationError]) -> Tuple[Optional[Dict], bytes]:
+        """Extract YAML frontmatter, reading on from head only as far as the closing ---.
+
+        Returns the parsed frontmatter and the bytes already read past it. Errors are
+        only appended when the frontmatter is missing, unclosed or not valid YAML.
+        """
+        buffer = bytearray(head)
+        if not buffer.startswith(b'---'):
+            errors.append(ValidationError(file_path, "MISSING_FRONTMATTER", "File must start with YAML frontmatter"))
+            return None, bytes(buffer)
             
-        # Find the closing ---
-        lines = content.split('\n')
-        frontmatter_end = -1
-        for i, line in enumerate(lines[1:], 1):
-            if line.strip() == '---':
-                frontmatter_end = i
+        # Read chunk by chunk until the closing --- is found
+        start = end = line_end = -1
+        pos = 0
+        at_eof = False
+        while True:
+            if start == -1:
+                newline = buffer.find(b'\n')
+                if newline != -1:
+                    start, pos = newline + 1, newline
+            if start != -1:
+                end, line_end, pos = self._find_closing_fence(buffer, pos, at_eof)
+                if end != -1:
+                    break
+            if at_eof:
                 break
+            chunk = next(chunks, b'')
+            at_eof = not chunk
+            buffer += chunk
                 
-        if frontmatter_end == -1:
-            self.errors.append(ValidationError(file_path, "INVALID_FRONTMATTER", "Frontmatter not properly closed with ---"))
-            return None, content
+        if end == -1:
+            errors.append(ValidationError(file_path, "INVALID_FRONTMATTER", "Frontmatter not properly closed with ---"))
+            return None, bytes(buffer)
             
-        frontmatter_content = '\n'.join(lines[1:frontmatter_end])
-        body_content = '\n'.join(lines[frontmatter_end + 1:])
+        frontmatter_content = buffer[start:end].decode('utf-8')
+        remainder = bytes(buffer[line_end + 1:])
         
         # Parse YAML
         try:
-            frontmatter = yaml.safe_load(frontmatter_content)
+            frontmatter = yaml.load(frontmatter_content, Loader=_YamlLoader)
         except yaml.YAMLError as e:
-            self.errors.append(ValidationError(file_path, "YAML_SYNTAX_ERROR", f"Invalid YAML syntax: {e}"))
-            return None, body_content
+            # LibYAML errors omit the source snippet, so re-parse with the pure-Python
+            # loader to report the more descriptive error
+            if _YamlLoader is not yaml.SafeLoader:
+                try:
+                    yaml.load(frontmatter_content, Loader=yaml.SafeLoader)
+                except yaml.YAMLError as detailed_error:
+                    e = detailed_error
+                    
+            # Marks are relative to the frontmatter slice, which starts on line 2. Shift them
+            # so the line numbers in the message match the reported file line
+            for mark in (getattr(e, 'context_mark', None), getattr(e, 'problem_mark', None)):
+                if mark is not None:
+                    mark.line += 1
+            mark = getattr(e, 'problem_mark', None)
+            line_number = mark.line + 1 if mark is not None else None
+            errors.append(ValidationError(file_path, "YAML_SYNTAX_ERROR", f"Invalid YAML syntax: {e}", line_number))
+            return None, remainder
+            
+        return frontmatter, remainder
+
+    @staticmethod
+    def _find_closing_fence(buffer: bytearray, pos: int, at_eof: bool) -> Tuple[int, int, int]:
+        """Search the buffer from pos for a closing --- line.
+
+        Returns the offsets of the newline before the fence and the newline ending it,
+        or -1 for both along with the position to resume from once more data is read.
+        """
+        fence = buffer.find(b'---', pos)
+        while fence != -1:
+            end = buffer.rfind(b'\n', 0, fence)
+            line_end = buffer.find(b'\n', fence + 3)
+            if line_end == -1:
+                if not at_eof:
+                    return -1, -1, end  # The fence line continues past the bytes read so far
+                line_end = len(buffer)
+            # Accept surrounding whitespace, including indentation
+            if not buffer[end + 1:fence].strip() and not buffer[fence + 3:line_end].strip():
+                return end, line_end, end
+            fence = buffer.find(b'---', line_end)
             
-        return frontmatter, body_content
+        # A fence may straddle the chunk boundary, so resume just short of the end
+        return -1, -1, max(len(buffer) - 2, pos)
 
-    def _validate_frontmatter(self, file_path: str, frontmatter: Dict):
+    def _iter_body_lines(self, chunks: Iterator[bytes], remainder: bytes) -> Iterator[str]:
+        """Decode and yield body lines, starting with bytes already read past the frontmatter."""
+        # Decoding strictly rather than scanning the body as bytes keeps invalid UTF-8
+        # anywhere in a document with valid frontmatter reported as a READ_ERROR
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        pending = ''
+        for chunk in chain((remainder,), chunks):
+            lines = (pending + decoder.decode(chunk)).split('\n')
+            pending = lines.pop()
+            yield from lines
+        yield pending + decoder.decode(b'', final=True)
+
+    @staticmethod
+    def _check_encoding(buffered: bytes):
+        """Decode bytes already read, raising UnicodeDecodeError on invalid UTF-8.
+
+        The decoder is not finalized, so a multi-byte character cut off at the end of the
+        buffer is not mistaken for an error.
+        """
+        codecs.getincrementaldecoder('utf-8')().decode(buffered)
+
+    def _validate_frontmatter(self, file_path: str, frontmatter: Dict, errors: List[ValidationError]):
         """Validate frontmatter fields and values."""
         if not isinstance(frontmatter, dict):
-            self.errors.append(ValidationError(file_path, "INVALID_FRONTMATTER", "Frontmatter must be a YAML object"))
+            errors.append(ValidationError(file_path, "INVALID_FRONTMATTER", "Frontmatter must be a YAML object"))
             return
             
-        # Check required fields
-        for field, expected_type in self.REQUIRED_FIELDS.items():
-            if field not in frontmatter:
-                self.errors.append(ValidationError(file_path, "MISSING_REQUIRED_FIELD", f"Required field '{field}' is missing"))
-                continue
-                
-            value = frontmatter[field]
-            if not isinstance(value, expected_type):
-                self.errors.append(ValidationError(file_path, "INVALID_FIELD_TYPE", 
+        append_error = errors.append
+        
+        # Check required fields, reporting any that are missing in declaration order
+        missing = self._REQUIRED_FIELD_NAMES - frontmatter.keys()
+        if missing:
+            for field in self.REQUIRED_FIELDS:
+                if field in missing:
+                    append_error(ValidationError(file_path, "MISSING_REQUIRED_FIELD", f"Required field '{field}' is missing"))
+                    
+        # Check field types in one pass over the frontmatter. YAML scalars load as exact
+        # str/list/dict, so the type identity check settles the common case before isinstance
+        field_types = self._FIELD_TYPES
+        for field, value in frontmatter.items():
+            expected_type = field_types.get(field)
+            if expected_type is not None and type(value) is not expected_type and not isinstance(value, expected_type):
+                append_error(ValidationError(file_path, "INVALID_FIELD_TYPE", 
                     f"Field '{field}' must be of type {expected_type.__name__}, got {type(value).__name__}"))
                     
         # Validate specific field values
         if 'category' in frontmatter:
             if frontmatter['category'] not in self.VALID_CATEGORIES:
-                self.errors.append(ValidationError(file_path, "INVALID_CATEGORY", 
-                    f"Category '{frontmatter['category']}' is not valid. Must be one of: {', '.join(self.VALID_CATEGORIES)}"))
+                append_error(ValidationError(file_path, "INVALID_CATEGORY", 
+                    f"Category '{frontmatter['category']}' is not valid. Must be one of: {self._VALID_CATEGORIES_STR}"))
                     
         if 'inclusion' in frontmatter:
             if frontmatter['inclusion'] not in self.VALID_INCLUSION_VALUES:
-                self.errors.append(ValidationError(file_path, "INVALID_INCLUSION", 
-                    f"Inclusion '{frontmatter['inclusion']}' is not valid. Must be one of: {', '.join(self.VALID_INCLUSION_VALUES)}"))
+                append_error(ValidationError(file_path, "INVALID_INCLUSION", 
+                    f"Inclusion '{frontmatter['inclusion']}' is not valid. Must be one of: {self._VALID_INCLUSION_VALUES_STR}"))
                     
         # Validate tags
         if 'tags' in frontmatter:
             tags = frontmatter['tags']
             if not isinstance(tags, list):
-                self.errors.append(ValidationError(file_path, "INVALID_TAGS", "Tags must be a list"))
+                append_error(ValidationError(file_path, "INVALID_TAGS", "Tags must be a list"))
             elif not tags:
-                self.errors.append(ValidationError(file_path, "EMPTY_TAGS", "Tags list cannot be empty"))
-            else:
-                for tag in tags:
-                    if not isinstance(tag, str):
-                        self.errors.append(ValidationError(file_path, "INVALID_TAG_TYPE", "All tags must be strings"))
-                        
-        # Check optional fields types
-        for field, expected_type in self.OPTIONAL_FIELDS.items():
-            if field in frontmatter:
-                value = frontmatter[field]
-                if not isinstance(value, expected_type):
-                    self.errors.append(ValidationError(file_path, "INVALID_FIELD_TYPE", 
-                        f"Field '{field}' must be of type {expected_type.__name__}, got {type(value).__name__}"))
-
-    def _validate_file_references(self, file_path: str, frontmatter: Dict):
+                append_error(ValidationError(file_path, "EMPTY_TAGS", "Tags list cannot be empty"))
+            elif not all(type(tag) is str for tag in tags):
+                append_error(ValidationError(file_path, "INVALID_TAG_TYPE", "All tags must be strings"))
+
+    def _validate_file_references(self, file_path: str, frontmatter: Dict, errors: List[ValidationError]):
         """Validate that referenced files exist."""
         if 'file_references' not in frontmatter:
             return
@@ -180,77 +338,295 @@ class SteeringValidator:
                 
             # Check if referenced file exists relative to the steering document
             ref_path = os.path.join(base_dir, ref)
-            if not os.path.exists(ref_path):
+            if not self._exists(ref_path):
                 # Also check relative to repository root
                 repo_root = self._find_repo_root(file_path)
                 if repo_root:
                     ref_path = os.path.join(repo_root, ref)
                     
-                if not os.path.exists(ref_path):
-                    self.errors.append(ValidationError(file_path, "MISSING_FILE_REFERENCE", 
+                if not self._exists(ref_path):
+                    errors.append(ValidationError(file_path, "MISSING_FILE_REFERENCE", 
                         f"Referenced file '{ref}' does not exist"))
 
-    def _validate_markdown_structure(self, file_path: str, body: str):
+    def _validate_markdown_structure(self, file_path: str, lines: Iterable[str], errors: List[ValidationError]):
         """Validate markdown structure and required sections."""
-        if not body.strip():
-            self.errors.append(ValidationError(file_path, "EMPTY_BODY", "Document body cannot be empty"))
+        has_content = False
+        found = set()
+        for line in lines:
+            if not has_content and line.strip():
+                has_content = True
+            if line.startswith('##'):
+                section = self._match_section_heading(line)
+                if section is not None:
+                    found.add(section)
+                    
+        if not has_content:
+            errors.append(ValidationError(file_path, "EMPTY_BODY", "Document body cannot be empty"))
             return
             
         # Check for required sections based on steering document standards
-        required_sections = [
-            r'##\s+Core Principle',
-            r'##\s+How Kiro Will Write',
-            r'##\s+What This Prevents'
-        ]
-        
-        for section_pattern in required_sections:
-            if not re.search(section_pattern, body, re.IGNORECASE):
-                section_name = section_pattern.replace(r'##\s+', '').replace(r'\s+', ' ')
-                self.errors.append(ValidationError(file_path, "MISSING_SECTION", 
+        for section_name in REQUIRED_SECTIONS:
+            if section_name.lower() not in found:
+                errors.append(ValidationError(file_path, "MISSING_SECTION", 
                     f"Required section '{section_name}' is missing"))
 
+    @staticmethod
+    def _match_section_heading(line: str) -> Optional[str]:
+        """Return the lowercased required section named by a line starting with ##.
+
+        The name must be followed by end of line (allowing closing #s) or by a space or colon introducing a subtitle, e.g. "## How Kiro Will Write Python".
+        Plain string operations stand in for a regex since this runs on every heading.
+        """
+        heading = line[2:]
+        title = heading.lstrip(' \t')
+        if len(title) == len(heading):
+            return None  # ## must be followed by a space or tab
+            
+        title = title.lower()
+        for section in _REQUIRED_SECTION_KEYS:
+            if title.startswith(section):
+                rest = title[len(section):]
+                if not rest or rest[0] in ' \t:':
+                    return section
+                return None if rest.strip(' \t#') else section
+        return None
+
+    def _exists(self, path: str) -> bool:
+        """Check whether a path exists, caching the answer by absolute path during a directory run."""
+        if self._exists_cache is None:
+            return os.path.exists(path)
+            
+        path = os.path.abspath(path)
+        exists = self._exists_cache.get(path)
+        if exists is None:
+            exists = os.path.exists(path)
+            self._exists_cache[path] = exists
+        return exists
+
     def _find_repo_root(self, file_path: str) -> Optional[str]:
-        """Find the repository root directory."""
+        """Find the repository root directory, caching the result for every directory walked."""
         current_dir = os.path.dirname(os.path.abspath(file_path))
+        visited = []
+        repo_root = None
         while current_dir != os.path.dirname(current_dir):  # Not at filesystem root
-            if os.path.exists(os.path.join(current_dir, '.git')):
-                return current_dir
+            cached = self._repo_root_cache.get(current_dir, _MISSING)
+            if cached is not _MISSING:
+                repo_root = cached
+                break
+            visited.append(current_dir)
+            # A single stat also accepts .git files used by worktrees and submodules
+            try:
+                os.stat(current_dir + _SEP + '.git')
+            except OSError:
+                pass
+            else:
+                repo_root = current_dir
+                break
             current_dir = os.path.dirname(current_dir)
-        return None
+            
+        for directory in visited:
+            self._repo_root_cache[directory] = repo_root
+        return repo_root
 
     def validate_directory(self, directory: str) -> Dict[str, List[ValidationError]]:
         """Validate all .md files in a directory."""
-        results = {}
-        
         if not os.path.exists(directory):
             return {directory: [ValidationError(directory, "DIRECTORY_NOT_FOUND", "Directory does not exist")]}
             
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.md') and file.upper() != 'README.MD':
-                    file_path = os.path.join(root, file)
-                    results[file_path] = self.validate_file(file_path)
-                    
+        self._exists_cache = {}
+        try:
+            return self._validate_directory(directory)
+        finally:
+            self._exists_cache = None
+
+    def _validate_directory(self, directory: str) -> Dict[str, List[ValidationError]]:
+        """Validate all .md files in an existing directory, reusing cached results if enabled."""
+        file_paths = list(self._iter_markdown_files(directory))
+        results: Dict[str, List[ValidationError]] = dict.fromkeys(file_paths)
+        if self.cache_path is None:
+            for file_path, (errors, _) in zip(file_paths, self._validate_files(file_paths)):
+                results[file_path] = errors
+            return results
+            
+        # Reuse results for files whose modification time and size are unchanged
+        cache = self._load_result_cache()
+        cache_keys = {}
+        stale_paths = []
+        for file_path in file_paths:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                stale_paths.append(file_path)
+                continue
+            cache_keys[file_path] = key = [stat.st_mtime_ns, stat.st_size]
+            cached_errors = self._cached_errors(cache.get(os.path.abspath(file_path)), file_path, key)
+            if cached_errors is None:
+                stale_paths.append(file_path)
+            else:
+                results[file_path] = cached_errors
+                
+        # Drop entries for files under this directory that no longer exist or are no longer validated
+        prefix = os.path.join(os.path.abspath(directory), '')
+        current_paths = {os.path.abspath(file_path) for file_path in file_paths}
+        removed_paths = [path for path in cache if path.startswith(prefix) and path not in current_paths]
+        for path in removed_paths:
+            del cache[path]
+        cache_changed = bool(removed_paths)
+        for file_path, (errors, self_contained) in zip(stale_paths, self._validate_files(stale_paths)):
+            results[file_path] = errors
+            abs_path = os.path.abspath(file_path)
+            if self_contained and file_path in cache_keys:
+                cache_changed = True
+                cache[abs_path] = {
+                    'key': cache_keys[file_path],
+                    'errors': [
+                        {'error_type': e.error_type, 'message': e.message, 'line_number': e.line_number}
+                        for e in errors
+                    ]
+                }
+            elif cache.pop(abs_path, None) is not None:
+                cache_changed = True
+                
+        if cache_changed:
+            self._save_result_cache(cache)
         return results
 
+    def _validate_files(self, file_paths: List[str]) -> List[Tuple[List[ValidationError], bool]]:
+        """Validate files in order, using a process pool when there are enough of them and cores to spare."""
+        cpu_count = os.cpu_count() or 1
+        min_files = self.PARALLEL_MIN_FILES
+        if multiprocessing.get_start_method() != 'fork':
+            min_files = self.PARALLEL_MIN_FILES_SPAWN
+        if len(file_paths) < min_files or cpu_count < 2:
+            return [self._validate_file(file_path) for file_path in file_paths]
+            
+        # Files are independent, so spread reading and YAML parsing across cores, sizing
+        # chunks so every worker gets several and no more workers start than there are chunks
+        chunksize = max(1, math.ceil(len(file_paths) / (cpu_count * self.PARALLEL_CHUNKS_PER_WORKER)))
+        max_workers = min(cpu_count, math.ceil(len(file_paths) / chunksize))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_validate_file_in_worker, file_paths, chunksize=chunksize))
+        except (OSError, NotImplementedError, BrokenProcessPool, pickle.PicklingError):
+            # Process pools are unavailable on some platforms, and workers cannot import this
+            # module when it was loaded through importlib; fall back to serial validation
+            return [self._validate_file(file_path) for file_path in file_paths]
+
+    @staticmethod
+    def _cached_errors(entry: object, file_path: str, key: List[int]) -> Optional[List[ValidationError]]:
+        """Rebuild cached errors for a file, or return None if the entry is stale or malformed."""
+        if not isinstance(entry, dict) or entry.get('key') != key or not isinstance(entry.get('errors'), list):
+            return None
+            
+        errors = []
+        for error in entry['errors']:
+            if (not isinstance(error, dict) or error.keys() != {'error_type', 'message', 'line_number'}
+                    or not isinstance(error['error_type'], str) or not isinstance(error['message'], str)
+                    or not (error['line_number'] is None or type(error['line_number']) is int)):
+                return None
+            errors.append(ValidationError(file_path, error['error_type'], error['message'], error['line_number']))
+        return errors
+
+    def _load_result_cache(self) -> Dict[str, Dict]:
+        """Load cached results, discarding them if this script has changed since they were written."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+            
+        if not isinstance(data, dict) or data.get('validator') != _validator_stamp():
+            return {}
+        files = data.get('files')
+        return files if isinstance(files, dict) else {}
+
+    def _save_result_cache(self, files: Dict[str, Dict]):
+        """Write cached results atomically. The cache is best-effort, so failures are ignored."""
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'validator': _validator_stamp(), 'files': files}, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def _iter_markdown_files(self, directory: str) -> Iterator[str]:
+        """Yield steering document paths under a directory, files before subdirectories."""
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+            
+        subdirs = []
+        for entry in entries:
+            # DirEntry caches the file type from the directory listing, avoiding a stat per entry
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.md') and entry.name.upper() != 'README.MD':
+                yield entry.path
+                
+        for subdir in subdirs:
+            yield from self._iter_markdown_files(subdir)
+
+
+_worker_validator: Optional[SteeringValidator] = None
+
+
+def _validate_file_in_worker(file_path: str) -> Tuple[List[ValidationError], bool]:
+    """Validate a file using a validator that lives for the lifetime of the worker process."""
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = SteeringValidator()
+        # Workers only live for one directory run, so existence checks stay cached throughout
+        _worker_validator._exists_cache = {}
+    return _worker_validator._validate_file(file_path)
+
+
+def default_cache_path() -> str:
+    """Return the result cache location, honouring XDG_CACHE_HOME."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'kiro-steering-validate', 'index.json')
+
+
+def _validator_stamp() -> List:
+    """Identify this version of the script and YAML loader so cached results are dropped when either changes.
+
+    LibYAML accepts some frontmatter the pure-Python loader rejects, such as a tab after
+    a mapping colon, so results from one loader cannot stand in for the other.
+    """
+    stat = os.stat(os.path.abspath(__file__))
+    return [stat.st_mtime_ns, stat.st_size, _YamlLoader.__name__]
+
 
 def main():
     """Command line interface for the validation tool."""
-    if len(sys.argv) < 2:
-        print("Usage: python validate-steering.py <file_or_directory>")
+    args = sys.argv[1:]
+    use_cache = '--cache' in args
+    if use_cache:
+        args.remove('--cache')
+        
+    if not args:
+        print("Usage: python validate-steering.py [--cache] <file_or_directory>")
         print("       python validate-steering.py --help")
         sys.exit(1)
         
-    if sys.argv[1] == '--help':
+    if args[0] == '--help':
         print(__doc__)
         print("\nUsage:")
         print("  python validate-steering.py <file.md>           # Validate single file")
         print("  python validate-steering.py <directory>        # Validate all .md files in directory")
+        print("  python validate-steering.py --cache <directory> # Reuse results for unchanged files")
         print("  python validate-steering.py --help             # Show this help")
         sys.exit(0)
         
-    target = sys.argv[1]
-    validator = SteeringValidator()
+    target = args[0]
+    validator = SteeringValidator(cache_path=default_cache_path() if use_cache else None)
     
     if os.path.isfile(target):
         errors = validator.validate_file(target)